@@ -29,7 +29,7 @@ class InputTask(EOTask):
         :param value: A value that the task should provide as its result. If not set uses the value from initialization
         :return: Directly returns `value`
         """
-        return value or self.value
+        return self.value if value is None else value
 
 
 class OutputTask(EOTask):
@@ -54,8 +54,9 @@ class OutputTask(EOTask):
     def execute(self, data: object) -> object:
         """
         :param data: input data
-        :return: Same data, to be stored in results (for `EOPatch` returns shallow copy containing only `features`)
+        :return: Same data, to be stored in results. For `EOPatch` it returns a shallow copy containing only `features`,
+            unless all features are requested, in which case the `EOPatch` is returned as it is.
         """
-        if isinstance(data, EOPatch):
+        if isinstance(data, EOPatch) and self.features is not ...:
             return data.copy(features=self.features)
         return data
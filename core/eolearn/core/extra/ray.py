@@ -9,7 +9,9 @@ Copyright (c) 2021-2022 Matej Aleksandrov, Žiga Lukšič (Sinergise)
 This source code is licensed under the MIT license found in the LICENSE
 file in the root directory of this source tree.
 """
-from typing import Any, Callable, Collection, Generator, Iterable, List, Optional, Tuple, TypeVar, cast
+from typing import Any, Callable, Dict, Generator, Iterable, List, Optional, Sized, Tuple, TypeVar, cast
+
+from tqdm.auto import tqdm
 
 try:
     import ray
@@ -18,7 +20,7 @@ except ImportError as exception:
 
 from ..eoexecution import EOExecutor, _ExecutionRunParams, _ProcessingData
 from ..eoworkflow import WorkflowResults
-from ..utils.parallelize import _base_join_futures_iter, _ProcessingType
+from ..utils.parallelize import _make_copy_and_empty_given, _ProcessingType
 
 # pylint: disable=invalid-name
 _InputType = TypeVar("_InputType")
@@ -28,6 +30,21 @@ _OutputType = TypeVar("_OutputType")
 class RayExecutor(EOExecutor):
     """A special type of `EOExecutor` that works with Ray framework"""
 
+    def __init__(self, *args: Any, workers: Optional[int] = None, **kwargs: Any):
+        """
+        :param args: Positional arguments that will be propagated to `EOExecutor`.
+        :param workers: A number of workers reported for the Ray cluster. If not given, it will be set to the number of
+            CPUs in the cluster the first time the executor runs and cached for subsequent runs.
+        :param kwargs: Keyword arguments that will be propagated to `EOExecutor`.
+        """
+        super().__init__(*args, **kwargs)
+        self._cached_workers = workers
+
+    def refresh_workers(self) -> None:
+        """Clears the cached number of workers so that it will be obtained from the Ray cluster again at the next run.
+        This is useful if the size of the cluster changes, e.g. because of autoscaling."""
+        self._cached_workers = None
+
     def run(self, **tqdm_kwargs: Any) -> List[WorkflowResults]:  # type: ignore
         """Runs the executor using a Ray cluster
 
@@ -39,16 +56,23 @@ class RayExecutor(EOExecutor):
         if not ray.is_initialized():
             raise RuntimeError("Please initialize a Ray cluster before calling this method")
 
-        workers = ray.available_resources().get("CPU")
-        return super().run(workers=workers, multiprocess=True, **tqdm_kwargs)
+        if self._cached_workers is None:
+            self._cached_workers = int(ray.cluster_resources().get("CPU", 1))
+        return super().run(workers=self._cached_workers, multiprocess=True, **tqdm_kwargs)
 
     @classmethod
     def _run_execution(
         cls, processing_args: List[_ProcessingData], run_params: _ExecutionRunParams
     ) -> List[WorkflowResults]:
-        """Runs ray execution"""
-        futures = [_ray_workflow_executor.remote(workflow_args) for workflow_args in processing_args]
-        return join_ray_futures(futures, **run_params.tqdm_kwargs)
+        """Runs ray execution, where at most twice as many workflows as there are workers are submitted at once"""
+        max_in_flight = 2 * run_params.workers if run_params.workers else None
+        return _submit_with_backpressure(
+            _ray_workflow_executor,
+            ((workflow_args,) for workflow_args in processing_args),
+            max_in_flight,
+            total=len(processing_args),
+            **run_params.tqdm_kwargs,
+        )
 
     @staticmethod
     def _get_processing_type(*_: Any, **__: Any) -> _ProcessingType:
@@ -64,7 +88,10 @@ def _ray_workflow_executor(workflow_args: _ProcessingData) -> WorkflowResults:
 
 
 def parallelize_with_ray(
-    function: Callable[[_InputType], _OutputType], *params: Iterable[_InputType], **tqdm_kwargs: Any
+    function: Callable[[_InputType], _OutputType],
+    *params: Iterable[_InputType],
+    max_in_flight: Optional[int] = None,
+    **tqdm_kwargs: Any,
 ) -> List[_OutputType]:
     """Parallelizes function execution with Ray.
 
@@ -73,6 +100,9 @@ def parallelize_with_ray(
 
     :param function: A normal function that is not yet decorated by `ray.remote`.
     :param params: Iterables of parameters that will be used with given function.
+    :param max_in_flight: A maximal number of submitted tasks that haven't been resolved yet. New tasks are submitted
+        only once some of the running tasks finish, which keeps memory usage of the driver and Ray Plasma store bounded
+        regardless of the number of given parameters. By default, it is set to twice the number of CPUs in the cluster.
     :param tqdm_kwargs: Keyword arguments that will be propagated to `tqdm` progress bar.
     :return: A list of results in the order that corresponds with the order of the given input `params`.
     """
@@ -80,8 +110,42 @@ def parallelize_with_ray(
         raise RuntimeError("Please initialize a Ray cluster before calling this method")
 
     ray_function = ray.remote(function)
-    futures = [ray_function.remote(*function_params) for function_params in zip(*params)]
-    return join_ray_futures(futures, **tqdm_kwargs)
+    total = None
+    if params and all(isinstance(param, Sized) for param in params):
+        total = min(len(cast(Sized, param)) for param in params)
+    return _submit_with_backpressure(ray_function, zip(*params), max_in_flight, total=total, **tqdm_kwargs)
+
+
+def _submit_with_backpressure(
+    ray_function: Any,
+    function_params: Iterable[Tuple[Any, ...]],
+    max_in_flight: Optional[int],
+    total: Optional[int] = None,
+    update_interval: float = 0.5,
+    **tqdm_kwargs: Any,
+) -> List[Any]:
+    """Submits tasks of a function decorated by `ray.remote` in a way that at most `max_in_flight` of them are
+    unresolved at any time, monitors progress, and returns a list of results in the order of given parameters."""
+    if max_in_flight is None:
+        max_in_flight = 2 * int(ray.cluster_resources().get("CPU", 1))
+    max_in_flight = max(1, max_in_flight)
+
+    results: Dict[int, Any] = {}
+    future_to_position: Dict[ray.ObjectRef, int] = {}
+    with tqdm(total=total, **tqdm_kwargs) as pbar:
+        for position, args in enumerate(function_params):
+            if len(future_to_position) >= max_in_flight:
+                for ready_position, result in _wait_and_get(future_to_position, num_returns=1):
+                    results[ready_position] = result
+                    pbar.update(1)
+
+            future_to_position[ray_function.remote(*args)] = position
+
+        for ready_position, result in _iter_ready_results(future_to_position, update_interval):
+            results[ready_position] = result
+            pbar.update(1)
+
+    return [results[position] for position in range(len(results))]
 
 
 def join_ray_futures(futures: List[ray.ObjectRef], **tqdm_kwargs: Any) -> List[Any]:
@@ -115,10 +179,49 @@ def join_ray_futures_iter(
     :return: A generator that will be returning pairs `(index, result)` where `index` will define the position of future
         in the original list to which `result` belongs to.
     """
+    if not isinstance(futures, list):
+        raise ValueError(f"Parameters 'futures' should be a list but {type(futures)} was given")
+    future_to_position = {future: position for position, future in enumerate(_make_copy_and_empty_given(futures))}
+
+    return _resolve_ray_futures_iter(future_to_position, update_interval, **tqdm_kwargs)
+
+
+def _resolve_ray_futures_iter(
+    future_to_position: Dict[ray.ObjectRef, int], update_interval: float, **tqdm_kwargs: Any
+) -> Generator[Tuple[int, Any], None, None]:
+    """Waits for batches of ready futures and fetches their results with a single `ray.get` call. Resolved futures are
+    removed from the given dictionary so that their objects can be released from Ray Plasma store."""
+    with tqdm(total=len(future_to_position), **tqdm_kwargs) as pbar:
+        for position, result in _iter_ready_results(future_to_position, update_interval):
+            pbar.update(1)
+            yield position, result
+
+
+def _iter_ready_results(
+    future_to_position: Dict[ray.ObjectRef, int], update_interval: float
+) -> Generator[Tuple[int, Any], None, None]:
+    """Resolves all given futures in batches of at most as many futures as there are CPUs in the cluster. Each wait is
+    limited by `update_interval`, so that results of finished futures are served without waiting for the others."""
+    batch_size = max(1, int(ray.cluster_resources().get("CPU", 1)))
 
-    def _ray_wait_function(
-        remaining_futures: Collection[ray.ObjectRef],
-    ) -> Tuple[Collection[ray.ObjectRef], Collection[ray.ObjectRef]]:
-        return ray.wait(remaining_futures, num_returns=len(remaining_futures), timeout=float(update_interval))
+    while future_to_position:
+        yield from _wait_and_get(
+            future_to_position, num_returns=min(len(future_to_position), batch_size), timeout=float(update_interval)
+        )
+
+
+def _wait_and_get(
+    future_to_position: Dict[ray.ObjectRef, int], num_returns: int, timeout: Optional[float] = None
+) -> List[Tuple[int, Any]]:
+    """Waits for futures to become ready, fetches their results with a single `ray.get` call, and removes them from the
+    given dictionary. Returns pairs `(position, result)` of resolved futures.
+
+    With `fetch_local=True` Ray starts pulling objects of finished futures to the driver node in parallel while waiting,
+    therefore the subsequent `ray.get` call doesn't have to fetch them one by one.
+    """
+    done, _ = ray.wait(list(future_to_position), num_returns=num_returns, timeout=timeout, fetch_local=True)
+    if not done:
+        return []
 
-    return _base_join_futures_iter(_ray_wait_function, ray.get, futures, **tqdm_kwargs)
+    results = ray.get(done)
+    return [(future_to_position.pop(future), result) for future, result in zip(done, results)]
@@ -12,22 +12,35 @@ Copyright (c) 2017-2019 Blaž Sovdat, Andrej Burja (Sinergise)
 This source code is licensed under the MIT license found in the LICENSE
 file in the root directory of this source tree.
 """
-import uuid
+import itertools as it
+import secrets
 from typing import Sequence, Union, cast
 
 import geopandas as gpd
 import numpy as np
 from geopandas.testing import assert_geodataframe_equal
 
+_UID_COUNTER = it.count()
+_SCALAR_TYPES = (bool, int, float, complex, str, bytes)
+_FLOAT_BIT_VIEW_DTYPES = {2: np.uint16, 4: np.uint32, 8: np.uint64}
+
 
 def deep_eq(fst_obj: object, snd_obj: object) -> bool:
     """Compares whether fst_obj and snd_obj are deeply equal.
 
     In case when both fst_obj and snd_obj are of type np.ndarray or either np.memmap, they are compared using
-    np.array_equal(fst_obj, snd_obj). Otherwise, when they are lists or tuples, they are compared for length and then
-    deep_eq is applied component-wise. When they are dict, they are compared for key set equality, and then deep_eq is
-    applied value-wise. For all other data types that are not list, tuple, dict, or np.ndarray, the method falls back
-    to the __eq__ method.
+    np.array_equal(fst_obj, snd_obj), where NaN values of floating point arrays are considered equal. Otherwise, when
+    they are lists or tuples, they are compared for length and then deep_eq is applied component-wise. When they are
+    dict, they are compared for key set equality, and then deep_eq is applied value-wise. For all other data types that
+    are not list, tuple, dict, or np.ndarray, the method falls back to the __eq__ method.
+
+    Contiguous floating point arrays are first compared bit-wise, which is faster and doesn't require any additional
+    memory. Only if their binary representations differ, they are compared by value.
+
+    Objects are compared only if one of them is an instance of the type of the other one. The check is symmetric, e.g.
+    np.float64 values are compared with float values regardless of the order of arguments, while `1.0` and `1` are not
+    considered deeply equal. Booleans are an exception because `bool` is a subclass of `int`, but `True` and `1` are
+    not considered deeply equal.
 
     Because np.ndarray is not a hashable object, it is impossible to form a set of numpy arrays, hence deep_eq works
     correctly.
@@ -37,20 +50,39 @@ def deep_eq(fst_obj: object, snd_obj: object) -> bool:
     :return: `True` if objects are deeply equal, `False` otherwise
     """
     # pylint: disable=too-many-return-statements
-    if not isinstance(fst_obj, type(snd_obj)):
-        return False
+    fst_type, snd_type = type(fst_obj), type(snd_obj)
+    if fst_type is not snd_type:
+        # Subclasses, e.g. np.memmap, pd.Timestamp, or np.float64, are still compared with their base classes
+        if not (isinstance(fst_obj, snd_type) or isinstance(snd_obj, fst_type)) or bool in (fst_type, snd_type):
+            return False
+        if not isinstance(fst_obj, snd_type):
+            # Objects are swapped so that the comparison is always based on the more derived type
+            fst_obj, snd_obj = snd_obj, fst_obj
+
+    elif fst_type in _SCALAR_TYPES:
+        return fst_obj == snd_obj
 
     if isinstance(fst_obj, np.ndarray):
         snd_obj = cast(np.ndarray, snd_obj)
-        if fst_obj.dtype != snd_obj.dtype:
+        if fst_obj.shape != snd_obj.shape or fst_obj.dtype != snd_obj.dtype:
             return False
-        fst_nan_mask = np.isnan(fst_obj)
-        snd_nan_mask = np.isnan(snd_obj)
-        return np.array_equal(fst_obj[~fst_nan_mask], snd_obj[~snd_nan_mask]) and np.array_equal(
-            fst_nan_mask, snd_nan_mask
-        )
+        if fst_obj is snd_obj and fst_obj.dtype.kind != "O":
+            # Shallow copies of EOPatches share arrays, which therefore don't have to be compared element-wise
+            return True
+        bit_view_dtype = _FLOAT_BIT_VIEW_DTYPES.get(fst_obj.itemsize)
+        if fst_obj.dtype.kind == "f" and bit_view_dtype and fst_obj.flags.c_contiguous and snd_obj.flags.c_contiguous:
+            # Bit-wise equal arrays are also equal by value, otherwise values have to be compared, e.g. 0.0 and -0.0
+            if np.array_equal(fst_obj.view(bit_view_dtype), snd_obj.view(bit_view_dtype)):
+                return True
+        if fst_obj.dtype.kind in "fc":
+            return np.array_equal(fst_obj, snd_obj, equal_nan=True)
+        return np.array_equal(fst_obj, snd_obj)
 
     if isinstance(fst_obj, gpd.GeoDataFrame):
+        if not isinstance(snd_obj, gpd.GeoDataFrame):
+            return False
+        if fst_obj is snd_obj:
+            return True
         try:
             # We allow differences in index types and in dtypes of columns
             assert_geodataframe_equal(fst_obj, snd_obj, check_index_type=False, check_dtype=False)
@@ -77,12 +109,10 @@ def deep_eq(fst_obj: object, snd_obj: object) -> bool:
 def generate_uid(prefix: str) -> str:
     """Generates a (sufficiently) unique ID starting with the `prefix`.
 
-    The ID is composed of the prefix, a hexadecimal string obtained from the current time and a random hexadecimal
-    string. This makes the uid sufficiently unique.
+    The ID is composed of the prefix, a hexadecimal value of a process-wide counter and a random hexadecimal string.
+    This makes the uid sufficiently unique.
     """
-    time_uid = uuid.uuid1(node=0).hex[:-12]
-    random_uid = uuid.uuid4().hex[:12]
-    return f"{prefix}-{time_uid}-{random_uid}"
+    return f"{prefix}-{next(_UID_COUNTER):08x}-{secrets.token_hex(6)}"
 
 
 def is_discrete_type(number_type: Union[np.dtype, type]) -> bool:
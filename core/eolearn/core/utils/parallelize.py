@@ -187,14 +187,14 @@ def _base_join_futures_iter(
         raise ValueError(f"Parameters 'futures' should be a list but {type(futures)} was given")
     remaining_futures: Collection[_FutureType] = _make_copy_and_empty_given(futures)
 
-    id_to_position_map = {id(future): index for index, future in enumerate(remaining_futures)}
+    future_to_position = {future: position for position, future in enumerate(remaining_futures)}
 
     with tqdm(total=len(remaining_futures), **tqdm_kwargs) as pbar:
         while remaining_futures:
             done, remaining_futures = wait_function(remaining_futures)
             for future in done:
                 result = get_result_function(future)
-                result_position = id_to_position_map[id(future)]
+                result_position = future_to_position.pop(future)
                 pbar.update(1)
                 yield result_position, result
 
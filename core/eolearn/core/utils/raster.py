@@ -81,42 +81,24 @@ def constant_pad(
     :param left_right_rule: Add padded columns evenly to the left/right of the image, or left / right only
     :param pad_value: Value to be assigned to padded rows and columns
     """
-    rows, columns = array.shape[:2]
-    row_padding, col_padding = 0, 0
-
-    if rows % multiple_of[0]:
-        row_padding = (int(rows / multiple_of[0]) + 1) * multiple_of[0] - rows
-
-    if columns % multiple_of[1]:
-        col_padding = (int(columns / multiple_of[1]) + 1) * multiple_of[1] - columns
-
-    row_padding_up, row_padding_down, col_padding_left, col_padding_right = 0, 0, 0, 0
-
-    if row_padding > 0:
-        if up_down_rule == "up":
-            row_padding_up = row_padding
-        elif up_down_rule == "down":
-            row_padding_down = row_padding
-        elif up_down_rule == "even":
-            row_padding_up = int(row_padding / 2)
-            row_padding_down = row_padding_up + (row_padding % 2)
-        else:
-            raise ValueError("Padding rule for rows not supported. Choose between even, down or up!")
-
-    if col_padding > 0:
-        if left_right_rule == "left":
-            col_padding_left = col_padding
-        elif left_right_rule == "right":
-            col_padding_right = col_padding
-        elif left_right_rule == "even":
-            col_padding_left = int(col_padding / 2)
-            col_padding_right = col_padding_left + (col_padding % 2)
-        else:
-            raise ValueError("Padding rule for columns not supported. Choose between even, left or right!")
-
-    return np.lib.pad(
-        array,
-        ((row_padding_up, row_padding_down), (col_padding_left, col_padding_right)),
-        "constant",
-        constant_values=((pad_value, pad_value), (pad_value, pad_value)),
-    )
+    row_padding = -array.shape[0] % multiple_of[0]
+    col_padding = -array.shape[1] % multiple_of[1]
+
+    row_padding_options = {
+        "up": (row_padding, 0),
+        "down": (0, row_padding),
+        "even": (row_padding // 2, row_padding - row_padding // 2),
+    }
+    if up_down_rule not in row_padding_options:
+        raise ValueError("Padding rule for rows not supported. Choose between even, down or up!")
+
+    col_padding_options = {
+        "left": (col_padding, 0),
+        "right": (0, col_padding),
+        "even": (col_padding // 2, col_padding - col_padding // 2),
+    }
+    if left_right_rule not in col_padding_options:
+        raise ValueError("Padding rule for columns not supported. Choose between even, left or right!")
+
+    pad_width = (row_padding_options[up_down_rule], col_padding_options[left_right_rule]) + ((0, 0),) * (array.ndim - 2)
+    return np.pad(array, pad_width, mode="constant", constant_values=pad_value)
@@ -14,6 +14,7 @@ from typing import Any, Type
 import fs
 import geopandas as gpd
 import numpy as np
+import pandas as pd
 import pytest
 from fs.errors import CreateFailed, ResourceNotFound
 from fs.tempfs import TempFS
@@ -142,6 +143,21 @@ def test_save_load(eopatch, fs_loader):
         assert eopatch != eopatch3
 
 
+@mock_s3
+@pytest.mark.parametrize("fs_loader", FS_LOADERS)
+def test_save_load_subclassed_values(eopatch, fs_loader):
+    """Values of subclassed types, e.g. pandas timestamps and numpy scalars, are loaded as their base types."""
+    eopatch.timestamp = list(pd.date_range("2017-01-01", periods=2, freq="D"))
+    eopatch.meta_info["scale"] = np.float64(0.5)
+
+    with fs_loader() as temp_fs:
+        eopatch.save("/", filesystem=temp_fs)
+        loaded_eopatch = EOPatch.load("/", filesystem=temp_fs)
+
+        assert eopatch == loaded_eopatch
+        assert loaded_eopatch == eopatch
+
+
 @mock_s3
 @pytest.mark.parametrize("fs_loader", FS_LOADERS)
 def test_save_add_only_features(eopatch, fs_loader):
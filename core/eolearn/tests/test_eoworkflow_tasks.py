@@ -7,6 +7,8 @@ Copyright (c) 2021-2022 Matej Aleksandrov, Matej Batič, Miha Kadunc, Žiga Luk
 This source code is licensed under the MIT license found in the LICENSE
 file in the root directory of this source tree.
 """
+import numpy as np
+
 from eolearn.core import EONode, EOTask, EOWorkflow, FeatureType, LoadTask, OutputTask
 from eolearn.core.eoworkflow_tasks import InputTask
 
@@ -26,6 +28,12 @@ def test_input_task():
     assert task.execute() is None
     assert task.execute(value=42) == 42
 
+    task = InputTask(value=31)
+    assert task.execute(value=0) == 0
+
+    array = np.zeros(3)
+    assert task.execute(value=array) is array
+
 
 def test_output_task(test_eopatch):
     """Tests basic functionalities of OutputTask"""
@@ -39,6 +47,8 @@ def test_output_task(test_eopatch):
     assert len(new_eopatch.get_feature_list()) == 2
     assert new_eopatch.bbox == test_eopatch.bbox
 
+    assert OutputTask().execute(test_eopatch) is test_eopatch
+
 
 def test_output_task_in_workflow(test_eopatch_path, test_eopatch):
     load = EONode(LoadTask(test_eopatch_path))
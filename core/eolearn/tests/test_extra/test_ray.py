@@ -11,11 +11,13 @@ import itertools as it
 import logging
 import os
 import tempfile
+import time
 
 import pytest
 import ray
 from ray.exceptions import RayTaskError, TaskCancelledError
 
+import eolearn.core.extra.ray
 from eolearn.core import EOExecutor, EONode, EOTask, EOWorkflow, WorkflowResults
 from eolearn.core.eoworkflow_tasks import OutputTask
 from eolearn.core.extra.ray import RayExecutor, join_ray_futures, join_ray_futures_iter, parallelize_with_ray
@@ -59,6 +61,20 @@ def simple_cluster_fixture():
     ray.shutdown()
 
 
+@pytest.fixture(name="in_flight_counts")
+def in_flight_counts_fixture(monkeypatch):
+    """Records how many submitted tasks are unresolved each time results are awaited."""
+    in_flight_counts = []
+    wait_and_get = eolearn.core.extra.ray._wait_and_get
+
+    def _recording_wait_and_get(future_to_position, *args, **kwargs):
+        in_flight_counts.append(len(future_to_position))
+        return wait_and_get(future_to_position, *args, **kwargs)
+
+    monkeypatch.setattr(eolearn.core.extra.ray, "_wait_and_get", _recording_wait_and_get)
+    return in_flight_counts
+
+
 @pytest.fixture(scope="session", name="test_nodes")
 def test_nodes_fixture():
     example = EONode(ExampleTask())
@@ -167,6 +183,35 @@ def test_execution_results2(workflow, execution_kwargs, simple_cluster):
             assert workflow_results.outputs["output"] == 42
 
 
+def test_cached_workers(workflow, execution_kwargs, simple_cluster):
+    executor = RayExecutor(workflow, execution_kwargs, workers=42)
+    executor.run()
+    assert executor.general_stats["workers"] == 42
+
+    executor.refresh_workers()
+    executor.run()
+    cpu_count = executor.general_stats["workers"]
+    assert cpu_count == int(ray.cluster_resources()["CPU"])
+    assert isinstance(cpu_count, int)
+
+    executor.run()
+    assert executor.general_stats["workers"] == cpu_count
+
+
+def test_bounded_submission(test_nodes, in_flight_counts, simple_cluster):
+    example_node = test_nodes["example"]
+    workflow = EOWorkflow(list(test_nodes.values()))
+    execution_kwargs = [{example_node: {"arg1": idx}} for idx in range(10)]
+    execution_kwargs[7] = {example_node: {"arg1": None}}
+
+    results = RayExecutor(workflow, execution_kwargs, workers=1).run()
+
+    assert max(in_flight_counts) == 2, "At most twice as many executions as workers should be submitted at once"
+    assert len(results) == 10
+    for idx, workflow_results in enumerate(results):
+        assert workflow_results.workflow_failed() is (idx == 7)
+
+
 def test_keyboard_interrupt(simple_cluster):
     exception_node = EONode(KeyboardExceptionTask())
     workflow = EOWorkflow([exception_node])
@@ -229,17 +274,82 @@ def test_parallelize_with_ray():
     results = parallelize_with_ray(add, [0, 1, 2], it.repeat(0))
     assert results == [0, 1, 2]
 
+    assert parallelize_with_ray(add) == []
+
+
+class ProgressRecorder:
+    """A replacement for `tqdm` progress bar that records times of progress updates."""
+
+    instances = []
+
+    def __init__(self, *_, **__):
+        self.update_times = []
+        ProgressRecorder.instances.append(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        pass
 
-@ray.remote
-def plus_one(value):
+    def update(self, _):
+        self.update_times.append(time.monotonic())
+
+
+def sleep_and_return(seconds):
+    time.sleep(seconds)
+    return seconds
+
+
+class SleepTask(EOTask):
+    @staticmethod
+    def execute(*, seconds):
+        time.sleep(seconds)
+        return seconds
+
+
+def run_sleeps_with_parallelize(seconds):
+    parallelize_with_ray(sleep_and_return, seconds, max_in_flight=2)
+
+
+def run_sleeps_with_executor(seconds):
+    sleep_node = EONode(SleepTask())
+    execution_kwargs = [{sleep_node: {"seconds": value}} for value in seconds]
+    RayExecutor(EOWorkflow([sleep_node]), execution_kwargs, workers=4).run()
+
+
+@pytest.mark.parametrize("run_sleeps", [run_sleeps_with_parallelize, run_sleeps_with_executor])
+def test_progress_updates(run_sleeps, simple_cluster, monkeypatch):
+    monkeypatch.setattr(eolearn.core.extra.ray, "tqdm", ProgressRecorder)
+    ProgressRecorder.instances.clear()
+
+    run_sleeps([0.1, 3])
+
+    (progress,) = ProgressRecorder.instances
+    assert len(progress.update_times) == 2
+    assert progress.update_times[1] - progress.update_times[0] > 1, "Progress should be reported as tasks finish"
+
+
+@pytest.mark.parametrize("max_in_flight", [1, 3, 100])
+def test_parallelize_with_ray_max_in_flight(max_in_flight, in_flight_counts, simple_cluster):
+    results = parallelize_with_ray(plus_one_local, iter(range(20)), max_in_flight=max_in_flight)
+    assert results == list(range(1, 21))
+    assert max(in_flight_counts) == min(max_in_flight, 20)
+
+
+def plus_one_local(value):
     return value + 1
 
 
-def test_join_ray_futures(simple_cluster):
-    futures = [plus_one.remote(value) for value in range(5)]
+plus_one = ray.remote(plus_one_local)
+
+
+@pytest.mark.parametrize("future_num", [5, 300])
+def test_join_ray_futures(future_num, simple_cluster):
+    futures = [plus_one.remote(value) for value in range(future_num)]
     results = join_ray_futures(futures)
 
-    assert results == list(range(1, 6))
+    assert results == list(range(1, future_num + 1))
     assert futures == []
 
 
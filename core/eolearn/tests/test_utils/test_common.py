@@ -5,12 +5,17 @@ Copyright (c) 2017-2022 Matej Aleksandrov, Žiga Lukšič (Sinergise)
 This source code is licensed under the MIT license found in the LICENSE
 file in the root directory of this source tree.
 """
+import datetime
 import warnings
+from collections import OrderedDict
 
+import geopandas as gpd
 import numpy as np
+import pandas as pd
 import pytest
+from shapely.geometry import Point
 
-from eolearn.core.utils.common import is_discrete_type
+from eolearn.core.utils.common import deep_eq, is_discrete_type
 
 with warnings.catch_warnings():
     warnings.simplefilter("ignore", DeprecationWarning)
@@ -50,3 +55,77 @@ def test_is_discrete_type(number_type, is_discrete):
         numpy_dtype = np.dtype(number_type)
 
     assert is_discrete_type(numpy_dtype) is is_discrete
+
+
+@pytest.mark.parametrize(
+    "fst_array, snd_array, are_equal",
+    [
+        (np.array([1, 2, 3]), np.array([1, 2, 3]), True),
+        (np.array([1, 2, 3]), np.array([1, 2, 4]), False),
+        (np.array([1, 2, 3]), np.array([1, 2, 3], dtype=np.uint8), False),
+        (np.array([[1, 2, 3]]), np.array([1, 2, 3]), False),
+        (np.array([True, False]), np.array([True, False]), True),
+        (np.array([1.0, np.nan, 3.0]), np.array([1.0, np.nan, 3.0]), True),
+        (np.array([1.0, np.nan, 3.0]), np.array([1.0, 2.0, np.nan]), False),
+        (np.array([[np.nan, 1.0]]), np.array([np.nan, 1.0]), False),
+        (np.array([1 + 1j, np.nan]), np.array([1 + 1j, np.nan]), True),
+        (np.array([0.0, 1.0], dtype=np.float32), np.array([-0.0, 1.0], dtype=np.float32), True),
+        (np.array([[0.0, 1.0], [2.0, 3.0]]).T, np.array([[-0.0, 1.0], [2.0, 3.0]]).T, True),
+        (np.array([np.nan, 1.0]), np.array([-np.nan, 1.0]), True),
+        (np.array([0.0, 1.0]), np.array([0.0, 1.5]), False),
+        (np.array([1.0, np.nan, 3.0])[::2], np.array([1.0, 3.0]), True),
+        (np.ones((3, 2), dtype=np.float16).T, np.ones((2, 3), dtype=np.float16), True),
+        (np.array(["a", "b"]), np.array(["a", "b"]), True),
+    ],
+)
+def test_deep_eq_arrays(fst_array, snd_array, are_equal):
+    assert deep_eq(fst_array, snd_array) is are_equal
+    assert deep_eq(snd_array, fst_array) is are_equal
+
+
+GEODATAFRAME = gpd.GeoDataFrame({"values": [1, 2]}, geometry=[Point(0, 0), Point(1, 1)])
+
+
+@pytest.mark.parametrize(
+    "fst_obj, snd_obj, are_equal",
+    [
+        (1, 1, True),
+        (True, 1, False),
+        (True, True, True),
+        (np.bool_(True), True, False),
+        (1.0, 1, False),
+        (np.float64(0.5), 0.5, True),
+        (pd.Timestamp(2017, 1, 1), datetime.datetime(2017, 1, 1), True),
+        ("a", "a", True),
+        ([1, (2, "3")], [1, (2, "3")], True),
+        ([1, 2], (1, 2), False),
+        ({"a": [1, np.ones(3)]}, {"a": [1, np.ones(3)]}, True),
+        ({"a": 1}, {"a": 1.0}, False),
+        ({"a": 1}, {"a": True}, False),
+        (OrderedDict(a=1, b=2), {"b": 2, "a": 1}, True),
+        (GEODATAFRAME, GEODATAFRAME.copy(), True),
+        (pd.DataFrame(GEODATAFRAME), GEODATAFRAME, False),
+        ({"a": pd.DataFrame(GEODATAFRAME)}, {"a": GEODATAFRAME}, False),
+    ],
+)
+def test_deep_eq(fst_obj, snd_obj, are_equal):
+    assert deep_eq(fst_obj, snd_obj) == are_equal
+    assert deep_eq(snd_obj, fst_obj) == are_equal
+
+
+def test_deep_eq_same_object():
+    array = np.array([1.0, np.nan])
+    assert deep_eq(array, array)
+    assert deep_eq({"a": array}, {"a": array})
+
+    object_array = np.array([1.0, np.nan], dtype=object)
+    assert not deep_eq(object_array, object_array)
+
+
+def test_deep_eq_memmap(tmp_path):
+    array = np.arange(6, dtype=np.float32).reshape((2, 3))
+    memmap_array = np.memmap(tmp_path / "array.dat", dtype=array.dtype, mode="w+", shape=array.shape)
+    memmap_array[:] = array
+
+    assert deep_eq(array, memmap_array)
+    assert deep_eq(memmap_array, array)
@@ -51,6 +51,14 @@ def test_fast_nanpercentile(size: int, percentile: float, nan_ratio: float, dtyp
         (np.arange(60).reshape((6, 10)), (11, 11), "even", "even", 3, None),
         (np.ones((167, 210)), (256, 256), "even", "even", 3, None),
         (np.arange(6).reshape((2, 3)), (2, 2), "down", "even", 9, np.array([[0, 1, 2, 9], [3, 4, 5, 9]])),
+        (
+            np.arange(4).reshape((1, 2, 2)),
+            (2, 3),
+            "up",
+            "right",
+            7,
+            np.array([[[7, 7], [7, 7], [7, 7]], [[0, 1], [2, 3], [7, 7]]]),
+        ),
         (
             np.arange(6).reshape((3, 2)),
             (4, 4),
@@ -81,7 +81,9 @@ def test_superpixel(test_eopatch, task, expected_min, expected_max, expected_mea
 
     delta = 1e-3
 
-    assert np.amin(result) == pytest.approx(expected_min, delta), "Minimum values do not match."
-    assert np.amax(result) == pytest.approx(expected_max, delta), "Maxmum values do not match."
-    assert np.mean(result) == pytest.approx(expected_mean, delta), "Mean values do not match."
-    assert np.median(result) == pytest.approx(expected_median, delta), "Median values do not match."
+    result_min, result_median, result_max = np.percentile(result, [0, 50, 100])
+
+    assert result_min == pytest.approx(expected_min, delta), "Minimum values do not match."
+    assert result_max == pytest.approx(expected_max, delta), "Maxmum values do not match."
+    assert result.mean() == pytest.approx(expected_mean, delta), "Mean values do not match."
+    assert result_median == pytest.approx(expected_median, delta), "Median values do not match."
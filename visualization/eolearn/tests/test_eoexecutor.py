@@ -52,3 +52,7 @@ def test_report_creation(save_logs, include_logs):
         executor.make_report(include_logs=include_logs)
 
         assert os.path.exists(executor.get_report_path()), "Execution report was not created"
+
+        with open(executor.get_report_path()) as report_file:
+            report = report_file.read()
+        assert ("'arg3': 10" in report) is (save_logs and include_logs)
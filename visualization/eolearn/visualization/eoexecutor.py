@@ -12,12 +12,16 @@ file in the root directory of this source tree.
 """
 import base64
 import datetime as dt
+import html
 import importlib
 import inspect
 import os
+import sys
 import warnings
-from collections import defaultdict
-from typing import DefaultDict, List, Tuple
+from collections import Counter, defaultdict
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import DefaultDict, List, Optional, Tuple
 
 import fs
 import graphviz
@@ -30,6 +34,8 @@ from pygments.formatters.html import HtmlFormatter
 from eolearn.core import EOExecutor
 from eolearn.core.exceptions import EOUserWarning
 
+_REPORT_BUFFER_SIZE = 16384
+
 
 class EOExecutorVisualization:
     """Class handling EOExecutor visualizations, particularly creating reports"""
@@ -64,19 +70,20 @@ class EOExecutorVisualization:
 
         template = self._get_template()
 
-        execution_log_filenames = [fs.path.basename(log_path) for log_path in self.eoexecutor.get_log_paths()]
+        log_paths = self.eoexecutor.get_log_paths(full_path=False)
+        execution_log_filenames = [fs.path.basename(log_path) for log_path in log_paths]
         if self.eoexecutor.save_logs:
-            execution_logs = self.eoexecutor.read_logs() if include_logs else None
+            execution_logs = _LazyExecutionLogs(self.eoexecutor, log_paths) if include_logs else None
         else:
             execution_logs = ["No logs saved"] * len(self.eoexecutor.execution_kwargs)
 
-        html = template.render(
+        stream = template.stream(
             title=f"Report {self._format_datetime(self.eoexecutor.start_time)}",
             dependency_graph=dependency_graph,
             general_stats=self.eoexecutor.general_stats,
             exception_stats=self._get_exception_stats(),
             task_descriptions=self._get_node_descriptions(),
-            task_sources=self._render_task_sources(formatter),
+            task_sources=self._render_task_sources(),
             execution_results=self.eoexecutor.execution_results,
             execution_tracebacks=self._render_execution_tracebacks(formatter),
             execution_logs=execution_logs,
@@ -87,8 +94,9 @@ class EOExecutorVisualization:
 
         self.eoexecutor.filesystem.makedirs(self.eoexecutor.report_folder, recreate=True)
 
+        stream.enable_buffering(size=_REPORT_BUFFER_SIZE)
         with self.eoexecutor.filesystem.open(self.eoexecutor.get_report_path(full_path=False), "w") as file_handle:
-            file_handle.write(html)
+            stream.dump(file_handle)
 
     def _create_dependency_graph(self):
         """Provides an image of dependency graph"""
@@ -135,18 +143,19 @@ class EOExecutorVisualization:
     def _get_node_descriptions(self):
         """Prepares a list of node names and initialization parameters of their tasks"""
         descriptions = []
-        name_counts = defaultdict(lambda: 0)
+        name_counts = Counter()
 
         for node in self.eoexecutor.workflow.get_nodes():
-            node_name = node.get_name(name_counts[node.get_name()])
-            name_counts[node.get_name()] += 1
+            base_name = node.get_name()
+            node_name = node.get_name(name_counts[base_name])
+            name_counts[base_name] += 1
 
             descriptions.append(
                 {
                     "name": f"{node_name} ({node.uid})",
                     "uid": node.uid,
                     "args": {
-                        key: value.replace("<", "&lt;").replace(">", "&gt;")
+                        key: html.escape(value, quote=False)
                         for key, value in node.task.private_task_config.init_args.items()
                     },
                 }
@@ -154,9 +163,8 @@ class EOExecutorVisualization:
 
         return descriptions
 
-    def _render_task_sources(self, formatter):
+    def _render_task_sources(self):
         """Renders source code of EOTasks"""
-        lexer = pygments.lexers.get_lexer_by_name("python", stripall=True)
         sources = {}
 
         for node in self.eoexecutor.workflow.get_nodes():
@@ -167,21 +175,9 @@ class EOExecutorVisualization:
                 continue
 
             if task.__module__.startswith("eolearn"):
-                subpackage_name = ".".join(task.__module__.split(".")[:2])
-                subpackage = importlib.import_module(subpackage_name)
-                subpackage_version = subpackage.__version__ if hasattr(subpackage, "__version__") else "unknown"
-                source = subpackage_name, subpackage_version
+                sources[key] = _get_subpackage_info(task.__module__)
             else:
-                try:
-                    source = inspect.getsource(task.__class__)
-                    source = pygments.highlight(source, lexer, formatter)
-                except TypeError:
-                    # Jupyter notebook does not have __file__ method to collect source code
-                    # StackOverflow provides no solutions
-                    # Could be investigated further by looking into Jupyter Notebook source code
-                    source = None
-
-            sources[key] = source
+                sources[key] = _highlight_task_source(task.__class__)
 
         return sources
 
@@ -220,3 +216,50 @@ class EOExecutorVisualization:
     def _format_timedelta(value1: dt.datetime, value2: dt.datetime) -> str:
         """Method for formatting time delta into report"""
         return str(value2 - value1)
+
+
+class _LazyExecutionLogs(Sequence):
+    """A sequence of execution logs that reads a log file only when its content is requested. This way a streamed
+    report doesn't need to keep the content of all log files in memory at the same time."""
+
+    def __init__(self, eoexecutor: EOExecutor, log_paths: List[str]):
+        """
+        :param eoexecutor: An instance of EOExecutor that saved the logs
+        :param log_paths: Paths to log files, relative to the filesystem of the executor
+        """
+        self.eoexecutor = eoexecutor
+        self.log_paths = log_paths
+
+    def __len__(self) -> int:
+        return len(self.log_paths)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[idx] for idx in range(*index.indices(len(self)))]
+        # pylint: disable=protected-access
+        return self.eoexecutor._read_log_file(self.log_paths[index])
+
+
+@lru_cache(maxsize=None)
+def _get_subpackage_info(module_name: str) -> Tuple[str, str]:
+    """Provides a name and a version of an `eolearn` subpackage containing the given module"""
+    subpackage_name = ".".join(module_name.split(".")[:2])
+    subpackage = sys.modules.get(subpackage_name) or importlib.import_module(subpackage_name)
+    subpackage_version = subpackage.__version__ if hasattr(subpackage, "__version__") else "unknown"
+    return subpackage_name, subpackage_version
+
+
+@lru_cache(maxsize=None)
+def _highlight_task_source(task_class: type) -> Optional[str]:
+    """Renders source code of an EOTask class. Results are cached because reading source code requires reading and
+    parsing the entire source file of a class."""
+    try:
+        source = inspect.getsource(task_class)
+    except TypeError:
+        # Jupyter notebook does not have __file__ method to collect source code
+        # StackOverflow provides no solutions
+        # Could be investigated further by looking into Jupyter Notebook source code
+        return None
+
+    lexer = pygments.lexers.get_lexer_by_name("python", stripall=True)
+    return pygments.highlight(source, lexer, HtmlFormatter(linenos=True))